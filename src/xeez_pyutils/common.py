@@ -1,28 +1,23 @@
-from typing import Union
+from pydantic import BaseModel, ConfigDict
 
 
-class CommonQueryParams:
+class CommonQueryParams(BaseModel):
     """
-    Classe para representar parâmetros de consulta comuns.
+    Modelo para representar parâmetros de consulta comuns.
 
-    Esta classe encapsula os parâmetros de consulta que são comumente usados
-    em endpoints, como parâmetros de pesquisa, salto e limite.
+    Este modelo encapsula os parâmetros de consulta que são comumente usados
+    em endpoints, como parâmetros de pesquisa, salto e limite. O modelo é
+    imutável (frozen), o que o torna hashable e seguro para compartilhar
+    entre dependências sem cópias defensivas.
 
     Attributes:
-        q (Union[str, None]): Parâmetro de consulta de pesquisa.
-        skip (int): Número de registros a serem ignorados.
-        limit (int): Número máximo de registros a serem retornados.
+        q (str | None): Parâmetro de consulta de pesquisa. Padrão é None.
+        skip (int): Número de registros a serem ignorados. Padrão é 0.
+        limit (int): Número máximo de registros a serem retornados. Padrão é 10.
     """
 
-    def __init__(self, q: Union[str, None] = None, skip: int = 0, limit: int = 10):
-        """
-        Inicializa os parâmetros de consulta comuns.
+    q: str | None = None
+    skip: int = 0
+    limit: int = 10
 
-        Args:
-            q (Union[str, None], optional): Parâmetro de consulta de pesquisa. Padrão é None.
-            skip (int, optional): Número de registros a serem ignorados. Padrão é 0.
-            limit (int, optional): Número máximo de registros a serem retornados. Padrão é 10.
-        """
-        self.q = q
-        self.skip = skip
-        self.limit = limit
+    model_config = ConfigDict(frozen=True)
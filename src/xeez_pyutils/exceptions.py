@@ -1,5 +1,7 @@
-from fastapi import Request
-from fastapi.responses import JSONResponse
+import json
+from typing import Awaitable, Callable, Type
+
+from fastapi import Request, Response
 
 from .responses import ErrorModel, ResponseModel
 
@@ -40,125 +42,81 @@ class DatabaseIntegrityError(Exception):
     pass
 
 
-async def bad_value_error_exception_handler(request: Request, exc: DatabaseError):
-    """Exception handler for BadValueError.
-
-    Args:
-        request (Request): The request object.
-        exc (DatabaseError): The exception object.
-
-    Returns:
-        JSONResponse: JSON response containing error details.
-
-    """
-
-    text = "Bad Value error"
-    message = text + ":" + str(exc) if str(exc) else text
-    error = ErrorModel(message=message, type="BadValueErr")
-    response_model: ResponseModel[None] = ResponseModel(success=False, error=error)
-    return JSONResponse(status_code=400, content=response_model.model_dump())
-
-
-async def database_integrity_error_exception_handler(
-    request: Request, exc: DatabaseError
-):
-    """Exception handler for DatabaseIntegrityError.
-
-    Args:
-        request (Request): The request object.
-        exc (DatabaseError): The exception object.
-
-    Returns:
-        JSONResponse: JSON response containing error details.
-
-    """
-
-    text = "Database Integrity error"
-    message = text + ":" + str(exc) if str(exc) else text
-    error = ErrorModel(message=message, type="DatabaseIntegrityErr")
-    response_model: ResponseModel[None] = ResponseModel(success=False, error=error)
-    return JSONResponse(status_code=400, content=response_model.model_dump())
-
-
-async def database_error_exception_handler(request: Request, exc: DatabaseError):
-    """Exception handler for DatabaseError.
+ExceptionHandler = Callable[[Request, Exception], Awaitable[Response]]
 
-    Args:
-        request (Request): The request object.
-        exc (DatabaseError): The exception object.
 
-    Returns:
-        JSONResponse: JSON response containing error details.
+def _build_template(err_type: str) -> bytes:
+    """Pre-serializa o envelope de erro com um placeholder para a mensagem.
 
+    O esqueleto do payload é constante por handler, então ele é renderizado
+    uma única vez no import; em tempo de execução apenas a mensagem dinâmica
+    é inserida no lugar do placeholder, sem reconstruir modelos Pydantic.
     """
-    text = "Database error"
-    message = text + ":" + str(exc) if str(exc) else text
-    error = ErrorModel(message=message, type="DatabaseErr")
+    error = ErrorModel(message="__MSG__", type=err_type)
     response_model: ResponseModel[None] = ResponseModel(success=False, error=error)
-    return JSONResponse(status_code=400, content=response_model.model_dump())
+    return response_model.model_dump_json().encode()
 
 
-async def not_found_exception_handler(request: Request, exc: NotFoundError):
-    """Exception handler for NotFoundError.
+def _render_payload(template: bytes, message: str) -> bytes:
+    """Insere a mensagem (já escapada como JSON) no template pré-serializado."""
+    return template.replace(b'"__MSG__"', json.dumps(message).encode())
 
-    Args:
-        request (Request): The request object.
-        exc (NotFoundError): The exception object.
 
-    Returns:
-        JSONResponse: JSON response containing error details.
+def _make_handler(text: str, err_type: str, status_code: int) -> ExceptionHandler:
+    """Cria um exception handler a partir do prefixo, tipo de erro e status.
 
-    """
-    text = "Not found"
-    message = text + ":" + str(exc) if str(exc) else text
-    error = ErrorModel(message=message, type="NotFound")
-    response_model: ResponseModel[None] = ResponseModel(success=False, error=error)
-    return JSONResponse(status_code=404, content=response_model.model_dump())
-
-
-async def duplicated_exception_handler(request: Request, exc: DuplicatedError):
-    """Exception handler for DuplicatedError.
+    Os seis handlers diferem apenas nesses três valores; a fábrica fecha
+    sobre o template pré-serializado e devolve a corrotina que o FastAPI
+    registra via add_exception_handler.
 
     Args:
-        request (Request): The request object.
-        exc (DuplicatedError): The exception object.
+        text (str): Prefixo da mensagem de erro.
+        err_type (str): Identificador do tipo de erro no payload.
+        status_code (int): Código de status HTTP da resposta.
 
     Returns:
-        JSONResponse: JSON response containing error details.
-
+        ExceptionHandler: Handler pronto para registro no FastAPI.
     """
-    text = "Duplicated entry"
-    message = text + ":" + str(exc) if str(exc) else text
-    error = ErrorModel(message=message, type="DuplicatedEntry")
-    response_model: ResponseModel[None] = ResponseModel(success=False, error=error)
-    return JSONResponse(status_code=400, content=response_model.model_dump())
-
-
-async def internal_server_error_exception_handler(
-    request: Request, exc: InternalServerError
-):
-    """Exception handler for InternalServerError.
-
-    Args:
-        request (Request): The request object.
-        exc (InternalServerError): The exception object.
-
-    Returns:
-        JSONResponse: JSON response containing error details.
-
-    """
-    text = "Unknown error"
-    message = text + ":" + str(exc) if str(exc) else text
-    error = ErrorModel(message=message, type="UnknownErr")
-    response_model: ResponseModel[None] = ResponseModel(success=False, error=error)
-    return JSONResponse(status_code=500, content=response_model.model_dump())
-
-
-exception_to_handler_list = [
-    (BadValueError, bad_value_error_exception_handler),
-    (NotFoundError, not_found_exception_handler),
-    (DuplicatedError, duplicated_exception_handler),
-    (InternalServerError, internal_server_error_exception_handler),
-    (DatabaseError, database_error_exception_handler),
-    (DatabaseIntegrityError, database_integrity_error_exception_handler),
-]
+    template = _build_template(err_type)
+    # Payload congelado para exceções sem detalhe: nesses casos a resposta
+    # inteira já está pronta em bytes e nenhum replace/escape é executado.
+    empty_payload = _render_payload(template, text)
+
+    async def handler(request: Request, exc: Exception) -> Response:
+        detail = str(exc)
+        if not detail:
+            return Response(
+                content=empty_payload,
+                status_code=status_code,
+                media_type="application/json",
+            )
+        return Response(
+            content=_render_payload(template, text + ":" + detail),
+            status_code=status_code,
+            media_type="application/json",
+        )
+
+    return handler
+
+
+_HANDLERS: dict[Type[Exception], ExceptionHandler] = {
+    BadValueError: _make_handler("Bad Value error", "BadValueErr", 400),
+    NotFoundError: _make_handler("Not found", "NotFound", 404),
+    DuplicatedError: _make_handler("Duplicated entry", "DuplicatedEntry", 400),
+    InternalServerError: _make_handler("Unknown error", "UnknownErr", 500),
+    DatabaseError: _make_handler("Database error", "DatabaseErr", 400),
+    DatabaseIntegrityError: _make_handler(
+        "Database Integrity error", "DatabaseIntegrityErr", 400
+    ),
+}
+
+# Aliases mantidos para compatibilidade com consumidores que importam os
+# handlers individualmente.
+bad_value_error_exception_handler = _HANDLERS[BadValueError]
+not_found_exception_handler = _HANDLERS[NotFoundError]
+duplicated_exception_handler = _HANDLERS[DuplicatedError]
+internal_server_error_exception_handler = _HANDLERS[InternalServerError]
+database_error_exception_handler = _HANDLERS[DatabaseError]
+database_integrity_error_exception_handler = _HANDLERS[DatabaseIntegrityError]
+
+exception_to_handler_list = list(_HANDLERS.items())
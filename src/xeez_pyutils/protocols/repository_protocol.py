@@ -13,19 +13,35 @@ class Transactional(Protocol, Generic[ModelType]):
     de objetos no banco de dados.
     """
 
-    def create(self, db_obj: ModelType, obj_in: dict[str, Any]) -> ModelType:
+    def create(
+        self, db_obj: ModelType, obj_in: dict[str, Any], refresh: bool = True
+    ) -> ModelType:
         """
         Cria um novo objeto no banco de dados.
 
         Parâmetros:
         - db_obj (ModelType): O objeto do banco de dados.
         - obj_in (dict): Um dicionário contendo os dados para criar o objeto.
+        - refresh (bool): Se True, recarrega o objeto após o commit para
+          popular valores gerados pelo servidor (padrão é True).
 
         Retorna:
         - ModelType: O objeto criado.
         """
         ...
 
+    def create_multi(self, objs_in: List[dict[str, Any]]) -> None:
+        """
+        Cria vários objetos no banco de dados em uma única instrução.
+
+        Parâmetros:
+        - objs_in (List[dict]): Os dados de cada objeto a ser criado.
+
+        Retorna:
+        - None
+        """
+        ...
+
     def update(self, db_obj: ModelType, obj_in: dict[str, Any]) -> None:
         """
         Atualiza um objeto existente no banco de dados.
@@ -142,6 +158,7 @@ class RepositoryProtocol(
     - get(id: Any) -> ModelType | None: Obtém um único objeto pelo seu ID.
     - get_multi(skip: int = 0, limit: int = 10) -> List[ModelType]: Obtém uma lista de objetos, com suporte para paginação.
     - create(db_obj: ModelType, obj_in: dict) -> ModelType: Cria um novo objeto no banco de dados.
+    - create_multi(objs_in: List[dict]) -> None: Cria vários objetos em uma única instrução.
     - update(db_obj: ModelType, obj_in: dict) -> None: Atualiza um objeto existente no banco de dados.
     - delete(db_obj: ModelType) -> None: Deleta um objeto do banco de dados.
     """
@@ -1,9 +1,51 @@
-from typing import Generic, Optional, TypeVar
+from typing import Any, Generic, Optional, Sequence, Type, TypeVar
+
+from fastapi import Response
 from pydantic import BaseModel, ConfigDict
 
+try:
+    import orjson  # noqa: F401
+
+    from fastapi.responses import ORJSONResponse
+
+    # Com o extra "orjson" instalado (pip install xeez-pyutils[orjson]),
+    # rotas que retornam dicts/listas serializam via orjson. Use em
+    # FastAPI(default_response_class=DefaultJSONResponse).
+    DefaultJSONResponse: Type[Response] = ORJSONResponse
+except ImportError:
+    from fastapi.responses import JSONResponse
+
+    DefaultJSONResponse = JSONResponse
+
 T = TypeVar("T")
 
 
+def list_to_response(
+    items: Sequence[BaseModel], status_code: int = 200
+) -> Response:
+    """Serializa uma lista de modelos diretamente para uma Response JSON.
+
+    Útil em endpoints de listagem (get_multi): cada item é serializado pelo
+    serializador Rust do Pydantic e os fragmentos são concatenados como
+    bytes, sem a travessia por linha do jsonable_encoder.
+
+    Args:
+        items (Sequence[BaseModel]): Itens a serem serializados.
+        status_code (int, optional): Código de status HTTP. Padrão é 200.
+
+    Returns:
+        Response: Resposta JSON já serializada contendo a lista.
+    """
+    body = b"[" + b",".join(
+        item.model_dump_json(exclude_none=True).encode() for item in items
+    ) + b"]"
+    return Response(
+        content=body,
+        status_code=status_code,
+        media_type="application/json",
+    )
+
+
 class ErrorModel(BaseModel):
     message: str
     type: Optional[str] = None
@@ -14,4 +56,50 @@ class ResponseModel(BaseModel, Generic[T]):
     success: bool
     error: Optional[ErrorModel] = None
     data: Optional[T] = None
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(
+        from_attributes=True,
+        ser_json_timedelta="iso8601",
+        ser_json_bytes="utf8",
+    )
+
+    def model_dump_json(self, **kwargs: Any) -> str:
+        """Serializa o modelo para JSON com os padrões do envelope pré-fixados.
+
+        Fixa exclude_none=True e by_alias=False uma única vez, para que todos
+        os chamadores usem o mesmo caminho rápido de serialização sem repetir
+        os kwargs em cada chamada.
+        """
+        kwargs.setdefault("exclude_none", True)
+        kwargs.setdefault("by_alias", False)
+        return super().model_dump_json(**kwargs)
+
+    def fast_dump(self) -> dict[str, Any]:
+        """Versão enxuta de model_dump no espírito de response_model_exclude_unset.
+
+        Emite apenas os campos explicitamente definidos e não-nulos, já em
+        modo JSON, produzindo o menor dict possível para o envelope — menos
+        campos para serializar e menos bytes na resposta.
+
+        Returns:
+            dict[str, Any]: Representação mínima do envelope.
+        """
+        return self.model_dump(mode="json", exclude_unset=True, exclude_none=True)
+
+    def to_response(self, status_code: int = 200) -> Response:
+        """Serializa o envelope diretamente para uma Response JSON.
+
+        Retornar esta Response do endpoint (em vez do próprio modelo) evita
+        que o FastAPI passe o payload pelo jsonable_encoder: a serialização
+        fica inteira no serializador Rust do Pydantic (model_dump_json).
+
+        Args:
+            status_code (int, optional): Código de status HTTP. Padrão é 200.
+
+        Returns:
+            Response: Resposta JSON já serializada.
+        """
+        return Response(
+            content=self.model_dump_json().encode(),
+            status_code=status_code,
+            media_type="application/json",
+        )
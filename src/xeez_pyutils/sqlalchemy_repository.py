@@ -1,7 +1,12 @@
-from typing import Any, List, Type, TypeVar
+import functools
+import logging
+from collections import OrderedDict
+from typing import Any, Callable, Final, List, Type, TypeVar
 
 from fastapi.logger import logger
 from pydantic import BaseModel, ValidationError
+from sqlalchemy import insert as sa_insert
+from sqlalchemy import update as sa_update
 from sqlalchemy.exc import IntegrityError, SQLAlchemyError
 from sqlalchemy.orm import Session
 
@@ -14,6 +19,41 @@ from .protocols.repository_protocol import RepositoryProtocol
 
 ModelType = TypeVar("ModelType", bound=BaseModel)
 
+# A partir deste limite, get_multi passa a materializar as linhas em lotes
+# via Query.yield_per, em vez de carregar o resultado inteiro de uma vez.
+_YIELD_PER_BATCH: Final = 500
+
+# Número máximo de entradas mantidas no cache LRU de get() por repositório.
+_GET_CACHE_MAXSIZE: Final = 128
+
+
+def _handle_db_errors(func: Callable) -> Callable:
+    """Converte erros do SQLAlchemy nas exceções de domínio do repositório.
+
+    Centraliza o rollback, o log e o re-raise que antes eram repetidos em
+    cada método: IntegrityError vira DatabaseIntegrityError e qualquer
+    outro SQLAlchemyError vira DatabaseError.
+    """
+
+    @functools.wraps(func)
+    def wrapper(self, *args: Any, **kwargs: Any) -> Any:
+        try:
+            return func(self, *args, **kwargs)
+        except IntegrityError as e:
+            self.session.rollback()
+            # Guarda de nível: stringificar exceções do SQLAlchemy pode ser
+            # caro; só formata se ERROR estiver de fato habilitado.
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Erro de Integridade do Banco de Dados: %s", e)
+            raise DatabaseIntegrityError(e.args)
+        except SQLAlchemyError as e:
+            self.session.rollback()
+            if logger.isEnabledFor(logging.ERROR):
+                logger.error("Erro do Banco de Dados: %s", e)
+            raise DatabaseError(e.args)
+
+    return wrapper
+
 
 class SQLAlchemyRepository(RepositoryProtocol[ModelType]):
     """
@@ -33,7 +73,23 @@ class SQLAlchemyRepository(RepositoryProtocol[ModelType]):
     def __init__(self, session: Session, model_type: Type[ModelType]):
         self.session = session
         self.model_type = model_type
-
+        # Cache LRU de leituras por chave primária, com o mesmo escopo de
+        # vida do repositório (e portanto da sessão). Entradas são removidas
+        # em update/delete para nunca servir estado obsoleto.
+        self._get_cache: OrderedDict[tuple[Type[ModelType], Any], ModelType] = (
+            OrderedDict()
+        )
+        # Query base construída uma única vez por repositório; os métodos
+        # generativos (offset/limit) derivam cópias dela, então reutilizá-la
+        # evita refazer a configuração de entidade a cada chamada.
+        self._base_query = self.session.query(self.model_type)
+
+    def _invalidate(self, db_obj: ModelType) -> None:
+        """Remove do cache a entrada correspondente ao objeto, se existir."""
+        key = (type(db_obj), getattr(db_obj, "id", None))
+        self._get_cache.pop(key, None)
+
+    @_handle_db_errors
     def get(self, model_type: Type[ModelType], id: Any) -> ModelType | None:
         """
         Obtém um objeto do banco de dados pelo ID.
@@ -44,22 +100,21 @@ class SQLAlchemyRepository(RepositoryProtocol[ModelType]):
         Returns:
             Any: O objeto obtido, se encontrado; caso contrário, None.
         """
-        try:
-            result = (
-                self.session.query(self.model_type or model_type)
-                .filter_by(id=id)
-                .first()
-            )
-            return result
-        except IntegrityError as e:
-            self.session.rollback()
-            logger.error("Erro de Integridade do Banco de Dados: %s", e)
-            raise DatabaseIntegrityError(e.args)
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            logger.error("Erro do Banco de Dados: %s", e)
-            raise DatabaseError(e.args)
-
+        key = (self.model_type or model_type, id)
+        cached = self._get_cache.get(key)
+        if cached is not None:
+            self._get_cache.move_to_end(key)
+            return cached
+        # Session.get consulta o identity map antes de ir ao banco e
+        # emite o SELECT por chave primária pré-compilado do ORM.
+        result = self.session.get(self.model_type or model_type, id)
+        if result is not None:
+            self._get_cache[key] = result
+            if len(self._get_cache) > _GET_CACHE_MAXSIZE:
+                self._get_cache.popitem(last=False)
+        return result
+
+    @_handle_db_errors
     def get_multi(
         self, model_type: Type[ModelType], skip: int = 0, limit: int = 10
     ) -> List[ModelType]:
@@ -74,53 +129,70 @@ class SQLAlchemyRepository(RepositoryProtocol[ModelType]):
         Returns:
             List[Any]: Uma lista de objetos obtidos.
         """
-        try:
-            result = (
-                self.session.query(self.model_type or model_type)
-                .offset(skip)
-                .limit(limit)
-                .all()
-            )
-            return result
-        except IntegrityError as e:
-            self.session.rollback()
-            logger.error("Erro de Integridade do Banco de Dados: %s", e)
-            raise DatabaseIntegrityError(e.args)
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            logger.error("Erro do Banco de Dados: %s", e)
-            raise DatabaseError(e.args)
-
-    def create(self, db_obj: ModelType, obj_in: dict[str, Any]) -> ModelType:
+        base = (
+            self._base_query
+            if self.model_type
+            else self.session.query(model_type)
+        )
+        query = base.offset(skip).limit(limit)
+        if limit >= _YIELD_PER_BATCH:
+            # Lotes grandes: usa cursor no servidor e busca em blocos,
+            # limitando o pico de memória do driver e do ORM.
+            return list(query.yield_per(_YIELD_PER_BATCH))
+        return query.all()
+
+    @_handle_db_errors
+    def create(
+        self, db_obj: ModelType, obj_in: dict[str, Any], refresh: bool = True
+    ) -> ModelType:
         """
         Cria um novo objeto no banco de dados.
 
         Args:
             db_obj (ModelType): O objeto a ser criado.
             obj_in (dict[str, Any]): Os dados do objeto a serem utilizados na criação.
+            refresh (bool, optional): Se True, recarrega o objeto após o commit
+                para popular valores gerados pelo servidor (defaults, triggers).
+                Passe False quando o chamador não precisa desses valores,
+                economizando um SELECT por criação. Padrão é True.
 
         Returns:
             Any: O objeto criado.
         """
         try:
             db_obj = self.model_type(**obj_in)
-            self.session.add(db_obj)
-            self.session.commit()
-            self.session.refresh(db_obj)
-            return db_obj
         except ValidationError as e:
             raise InternalServerError(
                 "Erro inesperado ao fazer o parsing para o modelo", e.args
             )
-        except IntegrityError as e:
-            self.session.rollback()
-            logger.error("Erro de Integridade do Banco de Dados: %s", e)
-            raise DatabaseIntegrityError(e.args)
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            logger.error("Erro do Banco de Dados: %s", e)
-            raise DatabaseError(e.args)
+        self.session.add(db_obj)
+        self.session.commit()
+        if refresh:
+            self.session.refresh(db_obj)
+        return db_obj
+
+    @_handle_db_errors
+    def create_multi(self, objs_in: List[dict[str, Any]]) -> None:
+        """
+        Cria vários objetos no banco de dados em uma única instrução.
+
+        Usa o INSERT em lote do SQLAlchemy ("executemany"), que envia todas
+        as linhas em um único round-trip, em vez de um add/flush por objeto.
+        Os objetos não são retornados: valores gerados pelo servidor devem
+        ser lidos posteriormente, se necessário.
+
+        Args:
+            objs_in (List[dict[str, Any]]): Os dados de cada objeto a ser criado.
+
+        Returns:
+            None
+        """
+        if not objs_in:
+            return
+        self.session.execute(sa_insert(self.model_type), objs_in)
+        self.session.commit()
 
+    @_handle_db_errors
     def update(self, db_obj: ModelType, obj_in: dict[str, Any]) -> None:
         """
         Atualiza um objeto existente no banco de dados.
@@ -132,21 +204,20 @@ class SQLAlchemyRepository(RepositoryProtocol[ModelType]):
         Returns:
             None
         """
-        try:
-            for key, value in obj_in.items():
-                setattr(db_obj, key, value)
-            self.session.add(db_obj)
-            self.session.commit()
-            self.session.refresh(db_obj)
-        except IntegrityError as e:
-            self.session.rollback()
-            logger.error("Erro de Integridade do Banco de Dados: %s", e)
-            raise DatabaseIntegrityError(e.args)
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            logger.error("Erro do Banco de Dados: %s", e)
-            raise DatabaseError(e.args)
-
+        if not obj_in:
+            # UPDATE sem cláusula SET é SQL inválido; preserva o comportamento
+            # de no-op do antigo loop de setattr para dicts vazios.
+            return
+        self._invalidate(db_obj)
+        model = type(db_obj)
+        # UPDATE único por critério: evita o loop de setattr atributo a
+        # atributo e o refresh posterior; o próprio ORM sincroniza os
+        # objetos carregados na sessão (synchronize_session="auto").
+        stmt = sa_update(model).where(model.id == db_obj.id).values(**obj_in)
+        self.session.execute(stmt)
+        self.session.commit()
+
+    @_handle_db_errors
     def delete(self, db_obj: ModelType) -> None:
         """
         Exclui um objeto do banco de dados.
@@ -157,14 +228,6 @@ class SQLAlchemyRepository(RepositoryProtocol[ModelType]):
         Returns:
             None
         """
-        try:
-            self.session.delete(db_obj)
-            self.session.commit()
-        except IntegrityError as e:
-            self.session.rollback()
-            logger.error("Erro de Integridade do Banco de Dados: %s", e)
-            raise DatabaseIntegrityError(e.args)
-        except SQLAlchemyError as e:
-            self.session.rollback()
-            logger.error("Erro do Banco de Dados: %s", e)
-            raise DatabaseError(e.args)
+        self._invalidate(db_obj)
+        self.session.delete(db_obj)
+        self.session.commit()